@@ -166,10 +166,10 @@
 # plt.close()
 
 # # 4. Create bar chart comparing operations by implementation type
-# plt.figure(figsize=(14, 8))
+# fig, ax = plt.subplots(figsize=(14, 8))
 
 # # We'll use fixed values for this comparison (16 credentials, 16 attributes)
-# comparison_df = df[(df['credential_count'] == 16) & (df['attribute_count'] == 16)]
+# comparison_df = df[(df['credential_count'] == 16) & (df['attribute_count'] == 16)].copy()
 
 # # Group implementations by type
 # impl_categories = {
@@ -178,60 +178,62 @@
 #     'Private (Multi Issuer)': ['multi_issuer_identity_binding', 'multi_issuer_identity_binding_show', 'multi_issuer_identity_binding_verify']
 # }
 
-# # Define x positions for the bars
-# bar_width = 0.2
-# x_positions = np.arange(len(impl_categories))
-
-# # Plot bars for different operations
-# for i, impl in enumerate(sorted(comparison_df['implementation'].unique())):
-#     values = []
-#     for category in impl_categories.keys():
-#         if impl in impl_categories[category]:
-#             val = comparison_df[comparison_df['implementation'] == impl]['mean_ms'].values[0]
-#             values.append(val)
-#         else:
-#             values.append(0)  # No bar for this category
-    
-#     # Only plot non-zero values
-#     non_zero_indices = [idx for idx, val in enumerate(values) if val > 0]
-#     non_zero_values = [values[idx] for idx in non_zero_indices]
-#     non_zero_positions = [x_positions[idx] + (i * bar_width - 0.3) for idx in non_zero_indices]
-    
-#     if non_zero_values:
-#         plt.bar(
-#             non_zero_positions,
-#             non_zero_values,
-#             width=bar_width,
-#             label=implementation_mapping[impl]
-#         )
+# # Tag each row with its category and let pandas lay out the grouped bars;
+# # an implementation is NaN outside its own category, so it draws no bar there
+# category_of = {impl: category for category, impls in impl_categories.items() for impl in impls}
+# comparison_df['category'] = comparison_df['implementation'].map(category_of)
+# pivot = comparison_df.pivot_table(
+#     index='category',
+#     columns='implementation_name',
+#     values='mean_ms',
+#     observed=True
+# ).reindex(list(impl_categories))
+# pivot.plot.bar(ax=ax, width=0.8, rot=0)
 
-# plt.title('Performance Comparison (16 Credentials, 16 Attributes)')
-# plt.xlabel('Implementation Category')
-# plt.ylabel('Execution Time (ms)')
-# plt.xticks(x_positions, impl_categories.keys())
-# plt.legend(loc='upper left')
-# plt.grid(True, alpha=0.3, axis='y')
+# ax.set_title('Performance Comparison (16 Credentials, 16 Attributes)')
+# ax.set_xlabel('Implementation Category')
+# ax.set_ylabel('Execution Time (ms)')
+# ax.legend(loc='upper left')
+# ax.grid(True, alpha=0.3, axis='y')
 
-# plt.tight_layout()
-# plt.savefig(f'{output_dir}/implementation_comparison.png', dpi=300)
-# plt.close()
+# fig.tight_layout()
+# fig.savefig(f'{output_dir}/implementation_comparison.png', dpi=300)
+# plt.close(fig)
 
 # print(f"Analysis complete. Results saved to {output_dir}/")
 
+import os
 import pandas as pd
+import matplotlib
+# Off-screen backend unless SHOW is set
+if not os.getenv('SHOW'):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 
+def load_extract(csv_path='extracts/extract.csv', parquet_path='extracts/extract.parquet'):
+    """Load the extracted data, preferring extractor.py's Parquet copy while it is up to date."""
+    csv_mtime = os.stat(csv_path).st_mtime_ns
+    if os.path.exists(parquet_path) and os.stat(parquet_path).st_mtime_ns >= csv_mtime:
+        try:
+            return pd.read_parquet(parquet_path)
+        except ImportError:
+            # No Parquet engine installed; the CSV holds the same data
+            pass
+    return pd.read_csv(csv_path)
+
 # Load the extracted data
-df = pd.read_csv('extracts/extract.csv')
+df = load_extract()
 
 
 # Create a directory for outputs
 output_dir = 'plots'
-import os
 os.makedirs(output_dir, exist_ok=True)
 
+# FAST=1 for quick low-dpi previews
+DPI = 100 if os.getenv('FAST') else 300
+
 # Set style for academic visualization
 sns.set_style("whitegrid")
 plt.rcParams.update({
@@ -258,94 +260,112 @@ style_props = {
     'Private, Multi Issuer': {'color': 'blue', 'linestyle': 'dotted', 'marker': 'o'},
 }
 
-# Apply the mapping
-df['implementation_name'] = df['implementation'].map(implementation_mapping)
+# Apply the mapping; categorical keys make the groupby/pivot below hash
+# small integer codes instead of strings
+df['implementation'] = df['implementation'].astype('category')
+# Rename the categories once instead of mapping every row. Unmapped
+# implementations become NaN, and ordering by display name keeps sorts and
+# pivot columns in the same order as before
+df['implementation_name'] = (
+    df['implementation']
+    .cat.set_categories(sorted(implementation_mapping, key=implementation_mapping.get))
+    .cat.rename_categories(implementation_mapping)
+)
+
+# Sort once so every group below comes out already ordered and no plotting
+# loop has to re-sort its slice
+df.sort_values(['attribute_count', 'implementation_name', 'credential_count'], inplace=True)
+
+# Every plot shares the same credential-count ticks
+cred_ticks = sorted(df['credential_count'].unique())
 
 # 1. Create line graphs by attribute count (with credentials on x-axis)
-for attr_count in sorted(df['attribute_count'].unique()):
-    plt.figure(figsize=(10, 6))
+# One figure is reused for every attribute count; only its axes are cleared
+fig, ax = plt.subplots(figsize=(10, 6))
+
+# Add a note about line styles (figure-level, so it survives ax.clear())
+fig.text(0.5, 0.01, "Solid lines = Non-Private, Dotted lines = Private", 
+         ha="center", fontsize=10, style='italic')
+
+for attr_count, attr_df in df.groupby('attribute_count', sort=False):
+    ax.clear()
     
-    # Filter data for this attribute count
-    attr_df = df[df['attribute_count'] == attr_count]
+    # Partition this attribute count by implementation in a single pass
+    impl_groups = dict(tuple(attr_df.groupby('implementation_name', sort=False, observed=True)))
     
     # Create line plot
-    for impl_name in style_props.keys():
-        if impl_name in attr_df['implementation_name'].values:
-            impl_df = attr_df[attr_df['implementation_name'] == impl_name]
-            
-            # Sort by credential count
-            impl_df = impl_df.sort_values('credential_count')
-            
-            # Plot with specified style
-            props = style_props[impl_name]
-            plt.plot(
-                impl_df['credential_count'], 
-                impl_df['mean_ms'], 
-                marker=props['marker'],
-                linestyle=props['linestyle'],
-                color=props['color'],
-                linewidth=2.5 if 'solid' in props['linestyle'] else 2,
-                markersize=8,
-                label=impl_name
-            )
-    
-    plt.title(f'Verification Time vs. Credential Count ({attr_count} Attributes per Credential)')
-    plt.xlabel('Number of Credentials')
-    plt.ylabel('Execution Time (ms)')
-    plt.xticks(sorted(df['credential_count'].unique()))
-    plt.legend(loc='best')
-    plt.grid(True, alpha=0.3)
+    for impl_name, props in style_props.items():
+        impl_df = impl_groups.get(impl_name)
+        if impl_df is None:
+            continue
+        
+        # Plot with specified style
+        ax.plot(
+            impl_df['credential_count'], 
+            impl_df['mean_ms'], 
+            marker=props['marker'],
+            linestyle=props['linestyle'],
+            color=props['color'],
+            linewidth=2.5 if 'solid' in props['linestyle'] else 2,
+            markersize=8,
+            label=impl_name
+        )
     
-    # Add a note about line styles
-    plt.figtext(0.5, 0.01, "Solid lines = Non-Private, Dotted lines = Private", 
-                ha="center", fontsize=10, style='italic')
+    ax.set_title(f'Verification Time vs. Credential Count ({attr_count} Attributes per Credential)')
+    ax.set_xlabel('Number of Credentials')
+    ax.set_ylabel('Execution Time (ms)')
+    ax.set_xticks(cred_ticks)
+    ax.legend(loc='best')
+    ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save figure
-    plt.savefig(f'{output_dir}/line_plot_attrs_{attr_count}.png', dpi=300)
-    plt.close()
+    fig.savefig(f'{output_dir}/line_plot_attrs_{attr_count}.png', dpi=DPI)
+
+plt.close(fig)
 
 # 2. Create a summary table with the new implementation names
 pivot_table = df.pivot_table(
     index=['attribute_count', 'credential_count'],
     columns='implementation_name',
-    values='mean_ms'
+    values='mean_ms',
+    aggfunc='mean',
+    observed=True
 )
 
 # Save to CSV
 pivot_table.to_csv(f'{output_dir}/summary_table.csv')
 
 # 3. Create a comparison plot showing scaling trends for all implementations
-plt.figure(figsize=(12, 8))
-
-# For each implementation, create a subplot showing scaling with credential count
-for i, impl in enumerate(df['implementation_name'].unique()):
-    plt.subplot(2, 2, i+1)
-    
-    impl_df = df[df['implementation_name'] == impl]
-    
-    # Create lines for each attribute count
-    for attr in sorted(impl_df['attribute_count'].unique()):
-        attr_impl_df = impl_df[impl_df['attribute_count'] == attr]
-        attr_impl_df = attr_impl_df.sort_values('credential_count')
-        
-        plt.plot(
-            attr_impl_df['credential_count'],
-            attr_impl_df['mean_ms'],
-            marker='o',
-            label=f'{attr} Attributes'
-        )
-    
-    plt.title(impl)
-    plt.xlabel('Number of Credentials')
-    plt.ylabel('Execution Time (ms)')
-    plt.xticks(sorted(df['credential_count'].unique()))
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.savefig(f'{output_dir}/scaling_comparison.png', dpi=300)
-plt.close()
+impl_names = df['implementation_name'].dropna().unique()
+n_rows = (len(impl_names) + 1) // 2
+fig, axes = plt.subplots(n_rows, 2, figsize=(12, 4 * n_rows), squeeze=False)
+axes_by_impl = dict(zip(impl_names, axes.flat))
+for ax in axes.flat[len(impl_names):]:
+    ax.set_visible(False)
+
+# One pass over the (already sorted) frame yields every (implementation,
+# attribute count) line; each is drawn on its implementation's subplot
+grouped = df.groupby(['implementation_name', 'attribute_count'], sort=False, observed=True)
+for (impl, attr), attr_impl_df in grouped:
+    axes_by_impl[impl].plot(
+        attr_impl_df['credential_count'],
+        attr_impl_df['mean_ms'],
+        marker='o',
+        label=f'{attr} Attributes'
+    )
+
+for impl, ax in axes_by_impl.items():
+    ax.set_title(impl)
+    ax.set_xlabel('Number of Credentials')
+    ax.set_ylabel('Execution Time (ms)')
+    ax.set_xticks(cred_ticks)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+fig.tight_layout()
+fig.savefig(f'{output_dir}/scaling_comparison.png', dpi=DPI)
+plt.close(fig)
 
 print(f"Analysis complete. Results saved to {output_dir}/")
\ No newline at end of file
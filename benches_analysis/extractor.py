@@ -1,72 +1,141 @@
 #!/usr/bin/env python3
 import json
+import os
+import pickle
+import stat
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Define the base directory for Criterion benchmark results
 BASE_DIR = Path("../../target/criterion/mimc_abc")
 
-def extract_mean_ms(json_file: Path) -> float:
+# Parsed means keyed by (path, mtime_ns) so unchanged files are not re-read
+CACHE_FILE = Path(".extract_cache.pkl")
+
+# Below this many uncached files, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+def extract_mean_ms(json_file: str) -> float:
     """Extract the mean execution time in milliseconds from a Criterion JSON file."""
     try:
-        with open(json_file, 'r') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(json_file, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(json_file, 'r') as f:
+                data = json.load(f)
         mean_ns = data['mean']['point_estimate']  # Mean time in nanoseconds
         return mean_ns / 1_000_000  # Convert to milliseconds
     except (FileNotFoundError, KeyError) as e:
         print(f"Error processing {json_file}: {e}")
         return None
 
-def extract_benchmark_data(base_dir: Path) -> pd.DataFrame:
+def load_cache(cache_file: Path) -> dict:
+    """Load the parsed-estimates cache, starting empty if it is missing or unreadable."""
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        return {}
+
+def save_cache(cache: dict, cache_file: Path) -> None:
+    """Persist the parsed-estimates cache."""
+    with open(cache_file, 'wb') as f:
+        pickle.dump(cache, f)
+
+def extract_benchmark_data(base_dir: Path, cache_file: Path = CACHE_FILE) -> pd.DataFrame:
     """Extract mimc_abc benchmark data from Criterion directories and return a DataFrame."""
-    all_data = []
+    tasks = []
+    impls, cred_counts, attr_counts, means = [], [], [], []
+    cache = load_cache(cache_file)
+    # Only entries seen in this run are kept, so stale files drop out of the cache
+    new_cache = {}
     
     # Check if base directory exists
     if not base_dir.exists():
         print(f"Error: Base directory {base_dir} does not exist!")
         return pd.DataFrame()
     
-    # For each implementation (top-level directory)
-    for impl_dir in base_dir.iterdir():
-        if not impl_dir.is_dir():
-            continue
-        
-        implementation = impl_dir.name
-        
-        # For each parameter set (subdirectory)
-        for param_dir in impl_dir.iterdir():
-            if not param_dir.is_dir():
+    # For each implementation (top-level directory); DirEntry caches the
+    # file type from the directory read, so is_dir() needs no extra stat
+    with os.scandir(base_dir) as impl_entries:
+        for impl_entry in impl_entries:
+            if not impl_entry.is_dir(follow_symlinks=False):
                 continue
             
-            # Parse parameter information (e.g., "4creds_16attrs")
-            param_name = param_dir.name
-            if "creds_" in param_name and "attrs" in param_name:
-                try:
-                    creds = int(param_name.split("creds_")[0])
-                    attrs = int(param_name.split("creds_")[1].split("attrs")[0])
-                except (ValueError, IndexError):
-                    print(f"Could not parse parameters from directory: {param_name}")
-                    continue
-                
-                # Find the estimates.json file
-                report_dir = param_dir / "new"
-                if report_dir.exists():
-                    json_file = report_dir / "estimates.json"
-                    if json_file.exists():
-                        mean_ms = extract_mean_ms(json_file)
-                        if mean_ms is not None:
-                            all_data.append({
-                                "implementation": implementation,
-                                "credential_count": creds,
-                                "attribute_count": attrs,
-                                "mean_ms": mean_ms
-                            })
+            implementation = impl_entry.name
+            
+            # For each parameter set (subdirectory)
+            with os.scandir(impl_entry.path) as param_entries:
+                for param_entry in param_entries:
+                    if not param_entry.is_dir(follow_symlinks=False):
+                        continue
+                    
+                    # Parse parameter information (e.g., "4creds_16attrs")
+                    param_name = param_entry.name
+                    if "creds_" in param_name and "attrs" in param_name:
+                        creds_str, _, rest = param_name.partition("creds_")
+                        attrs_str, _, _ = rest.partition("attrs")
+                        try:
+                            creds = int(creds_str)
+                            attrs = int(attrs_str)
+                        except ValueError:
+                            print(f"Could not parse parameters from directory: {param_name}")
+                            continue
+                        
+                        # Find the estimates.json file
+                        json_file = f"{param_entry.path}/new/estimates.json"
+                        # One stat both checks for a regular file and gives the cache mtime
+                        try:
+                            st = os.stat(json_file)
+                        except FileNotFoundError:
+                            continue
+                        if not stat.S_ISREG(st.st_mode):
+                            continue
+                        key = (json_file, st.st_mtime_ns)
+                        tasks.append((implementation, creds, attrs, key))
+    
+    # Parse only the files the cache has not seen at their current mtime
+    misses = [key for _, _, _, key in tasks if key not in cache]
+    miss_paths = [json_file for json_file, _ in misses]
+    if len(miss_paths) >= PARALLEL_MIN_FILES:
+        # A few chunks per worker keeps every core busy without per-file IPC
+        chunksize = max(1, len(miss_paths) // (4 * (os.cpu_count() or 1)))
+        with ProcessPoolExecutor() as executor:
+            parsed = list(executor.map(extract_mean_ms, miss_paths, chunksize=chunksize))
+    else:
+        parsed = [extract_mean_ms(json_file) for json_file in miss_paths]
+    cache.update(zip(misses, parsed))
+    
+    for implementation, creds, attrs, key in tasks:
+        mean_ms = cache.get(key)
+        if mean_ms is not None:
+            new_cache[key] = mean_ms
+            impls.append(implementation)
+            cred_counts.append(creds)
+            attr_counts.append(attrs)
+            means.append(mean_ms)
     
-    if not all_data:
+    save_cache(new_cache, cache_file)
+    
+    if not means:
         print("No benchmark data found in the specified directory!")
         return pd.DataFrame()
     
-    df = pd.DataFrame(all_data)
+    # Build from typed columns directly rather than inferring dtypes from row dicts
+    df = pd.DataFrame({
+        "implementation": pd.array(impls, dtype="category"),
+        "credential_count": np.asarray(cred_counts, dtype=np.int32),
+        "attribute_count": np.asarray(attr_counts, dtype=np.int32),
+        "mean_ms": np.asarray(means, dtype=np.float64)
+    })
     return df.sort_values(["implementation", "credential_count", "attribute_count"])
 
 def main():
@@ -83,9 +152,23 @@ def main():
     benchmark_df.to_csv(csv_file, index=False)
     print(f"Benchmark data successfully saved to {csv_file}")
     
+    # Save a columnar copy for analysis.py; the counts fit in int16, but
+    # mean_ms stays float64 because it feeds analysis.py's summary table
+    parquet_file = "extracts/extract.parquet"
+    compact_df = benchmark_df.astype({
+        "implementation": "category",
+        "credential_count": "int16",
+        "attribute_count": "int16"
+    })
+    try:
+        compact_df.to_parquet(parquet_file, index=False, compression="snappy")
+        print(f"Benchmark data successfully saved to {parquet_file}")
+    except ImportError as e:
+        print(f"Skipping {parquet_file}: {e}")
+    
     # Print basic information
     print(f"\nExtracted {benchmark_df.shape[0]} benchmark data points")
-    print(f"Implementations: {benchmark_df['implementation'].unique()}")
+    print(f"Implementations: {benchmark_df['implementation'].unique().tolist()}")
     print(f"Credential counts: {sorted(benchmark_df['credential_count'].unique())}")
     print(f"Attribute counts: {sorted(benchmark_df['attribute_count'].unique())}")
 
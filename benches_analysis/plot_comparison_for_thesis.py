@@ -1,93 +1,90 @@
+import os
+import matplotlib
+# Use Agg unless SHOW is set
+if not os.getenv('SHOW'):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+import numpy as np
+
+# Create a directory for outputs
+output_dir = 'plots'
+os.makedirs(output_dir, exist_ok=True)
+
+# FAST=1 saves previews at 100 dpi
+DPI = 100 if os.getenv('FAST') else 300
 
 # Data
-creds = [4, 16, 32]
-single_np = [2.87, 10.08, 19.55]
-single_p  = [7.11, 25.85, 50.64]
-multi_np  = [6.79, 27.45, 57.88]
-multi_p   = [17.65, 72.57, 147.35]
+creds = np.array([4, 16, 32])
+single_np = np.array([2.87, 10.08, 19.55])
+single_p  = np.array([7.11, 25.85, 50.64])
+multi_np  = np.array([6.79, 27.45, 57.88])
+multi_p   = np.array([17.65, 72.57, 147.35])
 
 # Colors and styles
 color_non = "#4A90E2"  # non-private multi-issuer color
 color_priv = "#E45932"  # private color
 
-# 1. Single-Issuer: Private vs Non-Private with annotations
-plt.figure(figsize=(6, 4))
-plt.plot(creds, single_p,  marker='o', label='Private Single-Issuer',     color=color_priv, linestyle='-')
-plt.plot(creds, single_np, marker='o', label='Non-Private Single-Issuer', color=color_non, linestyle='-')
-plt.plot([], [], ' ', label='2.x = Privacy Overhead')
-
-
-# Annotate overhead ratios
-for x, np_t, p_t in zip(creds, single_np, single_p):
-    ratio = p_t / np_t
-    plt.text(x, p_t + 2, f'{ratio:.1f}×', ha='center')
-
-plt.title('Single-Issuer: Privacy Overhead')
-plt.xlabel('Credential Count')
-plt.ylabel('Verification Time (ms)')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-# 2. Multi-Issuer: Private vs Non-Private (privacy overhead)
-plt.figure(figsize=(6, 4))
-plt.plot(creds, multi_p,  marker='o', label='Private Multi-Issuer',     color=color_priv, linestyle='-')
-plt.plot(creds, multi_np, marker='o', label='Non-Private Multi-Issuer', color=color_non, linestyle='-')
-plt.plot([], [], ' ', label='2.x = Privacy Overhead')  
-
-# Annotate overhead ratios
-for x, np_t, p_t in zip(creds, multi_np, multi_p):
-    ratio = p_t / np_t
-    plt.text(x, p_t + 4, f'{ratio:.1f}×', ha='center')
-
-plt.title('Multi-Issuer: Privacy Overhead')
-plt.xlabel('Credential Count')
-plt.ylabel('Verification Time (ms)')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-# 3. Single-Issuer vs Multi-Issuer with annotations
-plt.figure(figsize=(6, 4))
-plt.plot(creds, multi_p,  marker='o', label='Private Multi-Issuer',      color=color_priv, linestyle='-')
-plt.plot(creds, single_p, marker='o', label='Private Single-Issuer',     color=color_priv, linestyle=':')
-plt.plot([], [], ' ', label='2.x = Speedup from Batch Verify')  
-
-# Annotate overhead ratios
-for x, mp_t, sp_t in zip(creds, multi_p, single_p):
-    ratio = mp_t / sp_t
-    plt.text(x, sp_t + 2, f'{ratio:.1f}×', ha='center')
-
-plt.title('Private - Speedup from Batch Verify')
-plt.xlabel('Credential Count')
-plt.ylabel('Verification Time (ms)')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-# 4. Single-Issuer vs Multi-Issuer with annotations
-plt.figure(figsize=(6, 4))
-# Non-private lines
-plt.plot(creds, multi_np, marker='o', label='Non-Private Multi-Issuer',   color=color_non, linestyle='-')
-plt.plot(creds, single_np, marker='o', label='Non-Private Single-Issuer', color=color_non, linestyle=':')
-plt.plot([], [], ' ', label='2.x = Speedup from Batch Verify')  
-
-# Annotate overhead ratios
-for x, mnp_t, snp_t in zip(creds, multi_np, single_np):
-    ratio = mnp_t / snp_t
-    plt.text(x, snp_t +2, f'{ratio:.1f}×', ha='center')
-
-plt.title('Non Private - Speedup from Batch Verify')
-plt.xlabel('Credential Count')
-plt.ylabel('Verification Time (ms)')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+
+def plot_pair(ax, x, y1, y2, *, title, labels, colors, styles, note, label_y,
+              ratio_fmt='{:.1f}×'):
+    """Plot `y1` against `y2` on `ax` and annotate each point with y1/y2 at `label_y`."""
+    ax.plot(x, y1, marker='o', label=labels[0], color=colors[0], linestyle=styles[0])
+    ax.plot(x, y2, marker='o', label=labels[1], color=colors[1], linestyle=styles[1])
+    ax.plot([], [], ' ', label=note)
+
+    # Annotate ratios
+    for x_i, y_i, ratio in zip(x, label_y, y1 / y2):
+        ax.annotate(ratio_fmt.format(ratio), (x_i, y_i), ha='center')
+
+    ax.set_title(title)
+    ax.set_xlabel('Credential Count')
+    ax.set_ylabel('Verification Time (ms)')
+    ax.legend()
+    ax.grid(True)
+
+
+# One entry per thesis figure: output name, the two series (ratio is first /
+# second) and everything that differs between the figures
+overhead_note = '2.x = Privacy Overhead'
+speedup_note = '2.x = Speedup from Batch Verify'
+figures = [
+    # 1. Single-Issuer: Private vs Non-Private with annotations
+    ('single_issuer_privacy_overhead', single_p, single_np, dict(
+        title='Single-Issuer: Privacy Overhead',
+        labels=('Private Single-Issuer', 'Non-Private Single-Issuer'),
+        colors=(color_priv, color_non), styles=('-', '-'),
+        note=overhead_note, label_y=single_p + 2)),
+    # 2. Multi-Issuer: Private vs Non-Private (privacy overhead)
+    ('multi_issuer_privacy_overhead', multi_p, multi_np, dict(
+        title='Multi-Issuer: Privacy Overhead',
+        labels=('Private Multi-Issuer', 'Non-Private Multi-Issuer'),
+        colors=(color_priv, color_non), styles=('-', '-'),
+        note=overhead_note, label_y=multi_p + 4)),
+    # 3. Single-Issuer vs Multi-Issuer, private
+    ('private_batch_speedup', multi_p, single_p, dict(
+        title='Private - Speedup from Batch Verify',
+        labels=('Private Multi-Issuer', 'Private Single-Issuer'),
+        colors=(color_priv, color_priv), styles=('-', ':'),
+        note=speedup_note, label_y=single_p + 2)),
+    # 4. Single-Issuer vs Multi-Issuer, non-private
+    ('non_private_batch_speedup', multi_np, single_np, dict(
+        title='Non Private - Speedup from Batch Verify',
+        labels=('Non-Private Multi-Issuer', 'Non-Private Single-Issuer'),
+        colors=(color_non, color_non), styles=('-', ':'),
+        note=speedup_note, label_y=single_np + 2)),
+]
+
+# One Figure per plot; with SHOW set they stay open and are shown together
+show = os.getenv('SHOW')
+for name, y1, y2, options in figures:
+    fig, ax = plt.subplots(figsize=(6, 4))
+    plot_pair(ax, creds, y1, y2, **options)
+    fig.tight_layout()
+    fig.savefig(f'{output_dir}/{name}.png', dpi=DPI)
+    if not show:
+        plt.close(fig)
+if show:
+    plt.show()
 
 
 
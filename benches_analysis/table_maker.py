@@ -144,11 +144,17 @@
 #     f.write(restructured_table)
 
 
-import pandas as pd
-import numpy as np
+import csv
+import functools
+import math
+import os
+from pathlib import Path
 
-# Load CSV data
-df = pd.read_csv('extracts/extract.csv')
+CSV_PATH = 'extracts/extract.csv'
+
+# The tables only report this attribute count and these credential counts
+ATTR_COUNT = 16
+CRED_COUNTS = [4, 16, 32]
 
 # Define the implementation mappings based on the actual data
 implementations = {
@@ -164,131 +170,86 @@ implementations = {
     }
 }
 
-# Function to get value for a specific implementation, credential count and attribute count
-def get_value(implementation, cred_count, attr_count):
-    if implementation is None:
-        return np.nan
-        
-    result = df[(df['implementation'] == implementation) & 
-                (df['credential_count'] == cred_count) & 
-                (df['attribute_count'] == attr_count)]
-    if len(result) > 0:
-        return result['mean_ms'].values[0]
-    else:
-        return np.nan
-
-# Generate Single Issuer Table
-def generate_single_issuer_table():
-    # Table header
-    latex = "\\begin{table}[ht]\n"
-    latex += "\\centering\n"
-    latex += "\\caption{Single Issuer Performance Comparison (time in ms, 16 attributes per credential)}\n"
-    latex += "\\label{tab:single_issuer_performance}\n"
-    latex += "\\begin{tabular}{l@{\\hspace{1.5em}}r@{\\hspace{1.5em}}r@{\\hspace{1.5em}}r}\n"
-    latex += "\\toprule\n"
-    
-    # Fixed attribute count
-    attr_count = 16
-    
-    # Credential counts to include
-    cred_counts = [4, 16, 32]
-    
-    # Column headers
-    latex += "Operation & " + " & ".join([str(count) for count in cred_counts]) + " \\\\\n"
-    latex += "\\midrule\n"
-    
-    # Baseline public verify
-    row = ["Baseline Public Verify"]
-    for cred_count in cred_counts:
-        value = get_value(implementations['single_issuer']['baseline'], cred_count, attr_count)
-        row.append(f"{value:.2f}")
-    latex += " & ".join(row) + " \\\\\n"
-    
-    # Identity Binding Verify
-    row = ["Identity Binding Verify"]
-    for cred_count in cred_counts:
-        value = get_value(implementations['single_issuer']['verify'], cred_count, attr_count)
-        row.append(f"{value:.2f}")
-    latex += " & ".join(row) + " \\\\\n"
-    
-    # Identity Binding Show + Verify (using actual data)
-    row = ["Identity Binding Show + Verify"]
-    for cred_count in cred_counts:
-        verify_value = get_value(implementations['single_issuer']['verify'], cred_count, attr_count)
-        show_value = get_value(implementations['single_issuer']['show'], cred_count, attr_count)
-        total_value = verify_value + show_value
-        row.append(f"{total_value:.2f}")
-    latex += " & ".join(row) + " \\\\\n"
-    
-    # Table footer
-    latex += "\\bottomrule\n"
-    latex += "\\end{tabular}\n"
-    latex += "\\end{table}\n"
-    
-    return latex
-
-# Generate Multi Issuer Table
-def generate_multi_issuer_table():
-    # Table header
-    latex = "\\begin{table}[ht]\n"
-    latex += "\\centering\n"
-    latex += "\\caption{Multi Issuer Performance Comparison (time in ms, 16 attributes per credential)}\n"
-    latex += "\\label{tab:multi_issuer_performance}\n"
-    latex += "\\begin{tabular}{l@{\\hspace{1.5em}}r@{\\hspace{1.5em}}r@{\\hspace{1.5em}}r}\n"
-    latex += "\\toprule\n"
-    
-    # Fixed attribute count
-    attr_count = 16
-    
-    # Credential counts to include
-    cred_counts = [4, 16, 32]
-    
-    # Column headers
-    latex += "Operation & " + " & ".join([str(count) for count in cred_counts]) + " \\\\\n"
-    latex += "\\midrule\n"
-    
-    # Baseline public verify
-    row = ["Baseline Public Verify"]
-    for cred_count in cred_counts:
-        value = get_value(implementations['multi_issuer']['baseline'], cred_count, attr_count)
-        row.append(f"{value:.2f}")
-    latex += " & ".join(row) + " \\\\\n"
-    
-    # Identity Binding Verify
-    row = ["Identity Binding Verify"]
-    for cred_count in cred_counts:
-        value = get_value(implementations['multi_issuer']['verify'], cred_count, attr_count)
-        row.append(f"{value:.2f}")
-    latex += " & ".join(row) + " \\\\\n"
-    
-    # Identity Binding Show + Verify (using actual data)
-    row = ["Identity Binding Show + Verify"]
-    for cred_count in cred_counts:
-        verify_value = get_value(implementations['multi_issuer']['verify'], cred_count, attr_count)
-        show_value = get_value(implementations['multi_issuer']['show'], cred_count, attr_count)
-        total_value = verify_value + show_value
-        row.append(f"{total_value:.2f}")
-    latex += " & ".join(row) + " \\\\\n"
+# Only the implementations the tables read are kept while parsing
+NEEDED_IMPLEMENTATIONS = sorted({impl for ops in implementations.values() for impl in ops.values()})
+
+@functools.lru_cache(maxsize=1)
+def _load_table(path, mtime):
+    """Parse the extract CSV into {implementation: means at CRED_COUNTS}.
+
+    Only the ATTR_COUNT rows needed by the tables are kept, and cells with no
+    data are NaN. `mtime` is only part of the cache key, so an edited CSV is
+    parsed again.
+    """
+    needed = set(NEEDED_IMPLEMENTATIONS)
+    column_of = {count: i for i, count in enumerate(CRED_COUNTS)}
+    attr_count = str(ATTR_COUNT)
+    table = {impl: [math.nan] * len(CRED_COUNTS) for impl in NEEDED_IMPLEMENTATIONS}
+    seen = set()
+
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            impl = row['implementation']
+            if impl not in needed or row['attribute_count'] != attr_count:
+                continue
+            cred_count = int(row['credential_count'])
+            # Keep the first measurement per cell, as the old boolean-mask lookup did
+            if cred_count not in column_of or (impl, cred_count) in seen:
+                continue
+            seen.add((impl, cred_count))
+            table[impl][column_of[cred_count]] = float(row['mean_ms'])
+    return table
+
+def _build_lookup(path=CSV_PATH) -> dict[str, list[float]]:
+    """Return the shared lookup for both tables, re-reading the CSV only when its mtime changes."""
+    return _load_table(path, os.path.getmtime(path))
+
+# Table rows: label and the operations whose means are summed for that row
+TABLE_ROWS = [
+    ("Baseline Public Verify", ('baseline',)),
+    ("Identity Binding Verify", ('verify',)),
+    ("Identity Binding Show + Verify", ('verify', 'show'))
+]
+
+# Generate the performance table for one issuer setting
+def generate_table(issuer: str, caption: str, label: str, lookup) -> str:
+    cred_counts = CRED_COUNTS
+    ops = implementations[issuer]
+    
+    # Table header and column headers
+    parts = [
+        "\\begin{table}[ht]\n"
+        "\\centering\n"
+        f"\\caption{{{caption} (time in ms, {ATTR_COUNT} attributes per credential)}}\n"
+        f"\\label{{{label}}}\n"
+        "\\begin{tabular}{l@{\\hspace{1.5em}}r@{\\hspace{1.5em}}r@{\\hspace{1.5em}}r}\n"
+        "\\toprule\n"
+        f"Operation & {' & '.join(str(count) for count in cred_counts)} \\\\\n"
+        "\\midrule\n"
+    ]
+    
+    # Sum the operations of each row cell by cell and format the result
+    for row_label, row_ops in TABLE_ROWS:
+        values = map(sum, zip(*(lookup[ops[op]] for op in row_ops)))
+        parts.append(" & ".join([row_label, *(f"{value:.2f}" for value in values)]) + " \\\\\n")
     
     # Table footer
-    latex += "\\bottomrule\n"
-    latex += "\\end{tabular}\n"
-    latex += "\\end{table}\n"
+    parts.append("\\bottomrule\n\\end{tabular}\n\\end{table}\n")
     
-    return latex
+    return "".join(parts)
 
 # Generate and print the LaTeX tables
-single_issuer_table = generate_single_issuer_table()
-multi_issuer_table = generate_multi_issuer_table()
+lookup = _build_lookup()
+single_issuer_table = generate_table(
+    'single_issuer', "Single Issuer Performance Comparison", "tab:single_issuer_performance", lookup)
+multi_issuer_table = generate_table(
+    'multi_issuer', "Multi Issuer Performance Comparison", "tab:multi_issuer_performance", lookup)
 
 print("Single Issuer Table:")
 print(single_issuer_table)
 print("\nMulti Issuer Table:")
 print(multi_issuer_table)
 
-# Save to files
-with open('single_issuer_performance.tex', 'w') as f:
-    f.write(single_issuer_table)
-    
-with open('multi_issuer_performance.tex', 'w') as f:
-    f.write(multi_issuer_table)
\ No newline at end of file
+# Save the same strings to files, one write each
+Path('single_issuer_performance.tex').write_text(single_issuer_table)
+Path('multi_issuer_performance.tex').write_text(multi_issuer_table)